@@ -0,0 +1,135 @@
+"""
+Vectorized batches of independent board states.
+
+For rollout-style simulation (MCTS, self-play) many independent games
+evolve at once. Rather than instantiating one Board per game, BoardBatch
+stacks N boards into (N, 42) owner and army arrays so that per-player
+queries run as single numpy reductions along the territory axis for all
+boards at once.
+"""
+import numpy as np
+
+import risk.definitions
+import risk.kernels
+
+# (6, max_size) table of continent member territory_ids, padded by
+# repeating the last member so that an all(axis=-1) ownership test over a
+# row is unaffected by the padding.
+_cont_sizes = [len(risk.definitions.continent_territories[c]) for c in range(6)]
+CONT_TERR_IDX = np.array(
+    [risk.definitions.continent_territories[c]
+     + [risk.definitions.continent_territories[c][-1]] * (max(_cont_sizes) - _cont_sizes[c])
+     for c in range(6)], np.int8)
+
+
+class BoardBatch(object):
+    """
+    A stack of N independent Risk boards.
+
+    Args:
+        owners (ndarray): int8 array of shape (N, 42); owners[i, t] is the
+            player_id owning territory t on board i.
+        armies (ndarray): int32 array of shape (N, 42); armies[i, t] is the
+            number of armies on territory t on board i.
+    """
+
+    def __init__(self, owners, armies):
+        self.owners = owners
+        self.armies = armies
+
+    @classmethod
+    def create(cls, n_boards, n_players):
+        """
+        Create a batch of boards with independently random allocations,
+        one army on each territory.
+
+        Args:
+            n_boards (int): Number of boards in the batch.
+            n_players (int): Number of players per board.
+
+        Returns:
+            BoardBatch: A batch of freshly allocated boards.
+        """
+        owners = np.empty((n_boards, 42), np.int8)
+        risk.kernels.init_owners_batch_nb(n_players, owners)
+        return cls(owners, np.ones((n_boards, 42), np.int32))
+
+    @property
+    def n_boards(self):
+        """
+        The number of boards in the batch.
+
+        Returns:
+            int: Number of boards.
+        """
+        return self.owners.shape[0]
+
+    def owner(self, territory_id):
+        """
+        Get the owner of a territory on every board.
+
+        Args:
+            territory_id (int): ID of the territory.
+        Returns:
+            ndarray: int8 array of shape (N,) of player_ids.
+        """
+        return self.owners[:, territory_id]
+
+    def n_territories(self, player_id):
+        """
+        Count the territories owned by a player on every board.
+
+        Args:
+            player_id (int): ID of the player.
+        Returns:
+            ndarray: int32 array of shape (N,) of territory counts.
+        """
+        return (self.owners == player_id).sum(axis=1, dtype=np.int32)
+
+    def n_armies(self, player_id):
+        """
+        Count the total armies owned by a player on every board.
+
+        Args:
+            player_id (int): ID of the player.
+        Returns:
+            ndarray: int32 array of shape (N,) of army counts.
+        """
+        return np.where(self.owners == player_id, self.armies, 0).sum(axis=1, dtype=np.int32)
+
+    def owns_continent(self, player_id, continent_id):
+        """
+        Check on every board whether a player owns a continent.
+
+        Args:
+            player_id (int): ID of the player.
+            continent_id (int): ID of the continent.
+        Returns:
+            ndarray: bool array of shape (N,).
+        """
+        return (self.owners[:, CONT_TERR_IDX[continent_id]] == player_id).all(axis=1)
+
+    def mobile(self, player_id):
+        """
+        Find the territories of a player which can attack or move,
+        i.e. that have more than one army, on every board.
+
+        Args:
+            player_id (int): ID of the player.
+        Returns:
+            ndarray: bool array of shape (N, 42).
+        """
+        return (self.owners == player_id) & (self.armies > 1)
+
+    def reinforcements(self, player_id):
+        """
+        Calculate the reinforcements a player is entitled to on every board.
+
+        Args:
+            player_id (int): ID of the player.
+        Returns:
+            ndarray: int32 array of shape (N,) of reinforcement armies.
+        """
+        base = np.maximum(3, self.n_territories(player_id) // 3)
+        owned = (self.owners[:, CONT_TERR_IDX] == player_id).all(axis=-1)
+        return base + owned @ risk.definitions.continent_bonuses_array
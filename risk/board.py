@@ -4,15 +4,89 @@ import random
 from collections import namedtuple
 from collections import deque
 from queue import PriorityQueue
+import numpy as np
 import matplotlib.pyplot as plt
 import matplotlib.patches as patches
 from matplotlib.path import Path
 
 import risk.definitions
+import risk.kernels
 
 Territory = namedtuple('Territory', ['territory_id', 'player_id', 'armies'])
 Move = namedtuple('Attack', ['from_territory_id', 'from_armies', 'to_territory_id', 'to_player_id', 'to_armies'])
 
+# With only 42 territories, any set of territories fits in the lower bits of a
+# single int, so set membership and subset tests reduce to bitwise ANDs.
+CONTINENT_MASK = {
+    cid: sum(1 << t for t in tids)
+    for cid, tids in risk.definitions.continent_territories.items()}
+NEIGHBOR_MASK = tuple(
+    sum(1 << n for n in risk.definitions.territory_neighbors[t])
+    for t in range(42))
+ADJ = tuple(tuple(risk.definitions.territory_neighbors[t]) for t in range(42))
+CONT_SIZE = {cid: bin(mask).count('1') for cid, mask in CONTINENT_MASK.items()}
+TERR_TO_CONT = tuple(risk.definitions.territory_continents[t] for t in range(42))
+
+# Prototype starting arrays for create(): one tiled allocation per player
+# count plus the all-ones army array, copied per call so building a fresh
+# board is two memcpys instead of re-deriving the arrays.
+_ALLOC_PROTO = {n: np.resize(np.arange(n, dtype=np.int8), 42) for n in range(2, 7)}
+_ARMIES_PROTO = np.ones(42, np.int32)
+CONT_TERR = {
+    cid: np.array(tids, np.int8)
+    for cid, tids in risk.definitions.continent_territories.items()}
+
+
+def _specialize_reinforcements():
+    """
+    Generate a reinforcements method with the continent bonus table
+    inlined as straight-line code.
+
+    The continent sizes and bonuses are fixed at import time, so instead
+    of iterating the bonus dict and re-testing continent ownership on
+    every call, emit one constant test per continent against the
+    incrementally maintained _cont_owned counters and compile it once.
+    The returned function is bound as Board.reinforcements.
+    """
+    lines = [
+        'def reinforcements(self, player_id):',
+        '    """',
+        '    Calculate the number of reinforcements a player is entitled to.',
+        '',
+        '    Args:',
+        '        player_id (int): ID of the player.',
+        '    Returns:',
+        '        int: Number of reinforcement armies that the player is entitled to.',
+        '    """',
+        "    total = max(3, bin(self._owner_mask[player_id]).count('1') // 3)",
+        '    cont_owned = self._cont_owned',
+    ]
+    for cid in sorted(risk.definitions.continent_bonuses):
+        lines.append('    if cont_owned[{cid}][player_id] == {size}:'.format(
+            cid=cid, size=CONT_SIZE[cid]))
+        lines.append('        total += {bonus}  # {name}'.format(
+            bonus=risk.definitions.continent_bonuses[cid],
+            name=risk.definitions.continent_names[cid]))
+    lines.append('    return total')
+    namespace = {}
+    exec('\n'.join(lines), namespace)
+    return namespace['reinforcements']
+
+
+def _iter_bits(mask):
+    """
+    Create a generator of the indices of the set bits in a mask.
+
+    Args:
+        mask (int): a bitmask of territory_ids.
+    Returns:
+        generator: Generator of ints.
+    """
+    while mask:
+        bit = mask & -mask
+        yield bit.bit_length() - 1
+        mask ^= bit
+
 
 class Board(object):
     """
@@ -20,6 +94,13 @@ class Board(object):
     world map. Through the definitions it knows the locations of and
     connections between all territories. It handles ownership, attacks
     nd movements of armies.
+
+    Internally the state is stored as two parallel numpy arrays indexed
+    by territory_id: `owners` (the player_id owning each territory) and
+    `armies` (the number of armies on each territory), so that queries
+    over the whole board are single vectorized passes instead of
+    Python-level scans.
+
     Args:
         data (list): a sorted list of tuples describing the state of the
             board, each containing three values:
@@ -29,69 +110,123 @@ class Board(object):
             The list is sorted by the tid, and should be complete.
     """
 
+    # Static map data bound at class level, so the search loops resolve it
+    # with a single self-attribute lookup instead of a module attribute
+    # lookup plus dict subscript per step.
+    _NEI = ADJ
+
     def __init__(self, data):
-        self.data = data
+        self.owners = np.fromiter((t[1] for t in data), np.int8, len(data))
+        self.armies = np.fromiter((t[2] for t in data), np.int32, len(data))
+        self._init_caches()
+
+    def _init_caches(self):
+        """
+        Build the per-player caches from the owners and armies arrays.
+        Bit t of `_owner_mask[pid]` is set iff player pid owns territory t,
+        `_armies_total` holds per-player army totals, and
+        `_cont_owned[cid][pid]` counts the territories of continent cid
+        owned by player pid (the continent is fully owned iff the count
+        equals the continent size). All are kept up to date incrementally
+        by the mutators, so the per-player queries are O(1) instead of a
+        full board scan.
+        """
+        self._owner_mask = [0] * 6
+        self._armies_total = [0] * 6
+        self._cont_owned = [[0] * 6 for _ in range(6)]
+        for t, pid in enumerate(self.owners):
+            self._owner_mask[pid] |= 1 << t
+            self._armies_total[pid] += int(self.armies[t])
+            self._cont_owned[TERR_TO_CONT[t]][pid] += 1
+        self._n_players = int(self.owners.max()) + 1
+
+    @classmethod
+    def _from_arrays(cls, owners, armies):
+        """
+        Create a Board directly from owner and army arrays, without
+        building an intermediate list of Territory tuples.
+
+        Args:
+            owners (ndarray): int8 array of player_ids, indexed by territory_id.
+            armies (ndarray): int32 array of army counts, indexed by territory_id.
+
+        Returns:
+            Board: A board holding the given arrays.
+        """
+        board = cls.__new__(cls)
+        board.owners = owners
+        board.armies = armies
+        board._init_caches()
+        return board
 
     @classmethod
     def create(cls, n_players):
         """
         Create a Board and randomly allocate the territories. Place one army on each territory.
-        
+
         Args:
             n_players (int): Number of players.
-                
+
         Returns:
             Board: A board with territories randomly allocated to the players.
         """
-        allocation = (list(range(n_players)) * 42)[0:42]
-        random.shuffle(allocation)
-        return cls([Territory(territory_id=tid, player_id=pid, armies=1) for tid, pid in enumerate(allocation)])
+        allocation = _ALLOC_PROTO[n_players].copy()
+        np.random.shuffle(allocation)
+        return cls._from_arrays(allocation, _ARMIES_PROTO.copy())
+
+    @property
+    def n_players(self):
+        """
+        The number of players on the board, derived at construction and
+        kept up to date by set_owner.
+
+        Returns:
+            int: Number of players.
+        """
+        return self._n_players
 
     # ====================== #
     # == Neighbor Methods == #
-    # ====================== #   
+    # ====================== #
 
     def neighbors(self, territory_id):
         """
-        Create a generator of all territories neighboring a given territory.
-            
+        Find all territories neighboring a given territory.
+
         Args:
             territory_id (int): ID of the territory to find neighbors of.
         Returns:
-            generator: Generator of Territories.
+            tuple: Territory IDs of the neighbors.
         """
-        neighbor_ids = risk.definitions.territory_neighbors[territory_id]
-        return (t for t in self.data if t.territory_id in neighbor_ids)
+        return ADJ[territory_id]
 
     def hostile_neighbors(self, territory_id):
         """
-        Create a generator of all territories neighboring a given territory, of which
+        Find all territories neighboring a given territory, of which
         the owner is not the same as the owner of the original territory.
-            
+
         Args:
             territory_id (int): ID of the territory.
-                
+
         Returns:
-            generator: Generator of Territories.
+            list: Territory IDs of the hostile neighbors.
         """
-        player_id = self.owner(territory_id)
-        neighbor_ids = risk.definitions.territory_neighbors[territory_id]
-        return (t for t in self.data if (t.player_id != player_id and t.territory_id in neighbor_ids))
-        
+        mask = NEIGHBOR_MASK[territory_id] & ~self._owner_mask[self.owner(territory_id)]
+        return list(_iter_bits(mask))
+
     def friendly_neighbors(self, territory_id):
         """
-        Create a generator of all territories neighboring a given territory, of which
+        Find all territories neighboring a given territory, of which
         the owner is the same as the owner of the original territory.
         Args:
             territory_id (int): ID of the territory.
         Returns:
-            generator: Generator of tuples of the form (territory_id, player_id, armies).
+            list: Territory IDs of the friendly neighbors.
         """
-        player_id = self.owner(territory_id)
-        neighbor_ids = risk.definitions.territory_neighbors[territory_id]
-        return (t for t in self.data if (t.player_id == player_id and t.territory_id in neighbor_ids))
+        mask = NEIGHBOR_MASK[territory_id] & self._owner_mask[self.owner(territory_id)]
+        return list(_iter_bits(mask))
+
 
-    
     # ================== #
     # == Path Methods == #
     # ================== #
@@ -111,13 +246,13 @@ class Board(object):
         if len(path) <= 1:
             return ret
         ret &= path[0] not in path[1:]
-        ret &= path[1] in risk.definitions.territory_neighbors[path[0]]
+        ret &= path[1] in self._NEI[path[0]]
         ret &= self.is_valid_path(path[1:])
         return ret
-    
+
     def is_valid_attack_path(self, path):
         '''
-        The rules of Risk state that when attacking, 
+        The rules of Risk state that when attacking,
         a player's armies cannot move through territories they already occupy;
         they must move through enemy territories.
         All valid attacks, therefore, will follow a path of starting on one player's territory and moving trough enemy territories.
@@ -134,7 +269,7 @@ class Board(object):
         for tid in path[1:]:
             ret &= self.owner(tid) != self.owner(path[0])
         return ret
-        
+
     def cost_of_attack_path(self, path):
         '''
         The cost of an attack path is the total number of enemy armies in the path.
@@ -146,7 +281,7 @@ class Board(object):
         '''
         ret = 0
         for tid in path[1:]:
-            ret += self.data[tid].armies
+            ret += int(self.armies[tid])
         return ret
 
 
@@ -164,7 +299,7 @@ class Board(object):
         Returns:
             [int]: a valid path between source and target that has minimum length; this path is guaranteed to exist
         '''
-        
+
         dictionary = {}
         dictionary[source] = [source]
         queue = deque()
@@ -176,7 +311,7 @@ class Board(object):
             current_territory = queue.popleft()
             if current_territory == target:
                 return dictionary[current_territory]
-            for territory in risk.definitions.territory_neighbors[current_territory]:
+            for territory in self._NEI[current_territory]:
                 if territory not in visited:
                     new_territory = copy.deepcopy(dictionary[current_territory])
                     new_territory.append(territory)
@@ -206,7 +341,7 @@ class Board(object):
             current_territory = queue.popleft()
             if current_territory == target:
                 return True
-            n = risk.definitions.territory_neighbors[current_territory]
+            n = self._NEI[current_territory]
             for territory in n:
                 if territory not in visited and self.owner(source) == self.owner(territory):
                     visited.add(territory)
@@ -216,7 +351,7 @@ class Board(object):
                     queue.append(territory)
         return False
 
-        
+
 
 
     def cheapest_attack_path(self, source, target):
@@ -244,12 +379,12 @@ class Board(object):
             current_priority, current_territory = pq.get()
             if current_territory == target:
                 return dictionary[current_territory]
-            n = risk.definitions.territory_neighbors[current_territory]
+            n = self._NEI[current_territory]
             for territory in n:
                 if territory not in visited and pid != self.owner(territory):
                     new = dictionary[current_territory].copy()
                     new.append(territory)
-                    priority = current_priority + self.data[territory].armies
+                    priority = current_priority + int(self.armies[territory])
                     p = priority
                     t = territory
                     if territory not in [x[1] for x in pq.queue]:
@@ -283,12 +418,11 @@ class Board(object):
         queue.append(source)
         visited = set()
         visited.add(source)
-        print("queue=", queue)
         while queue:
             curr_country = queue.popleft()
             if curr_country == target:
                 return True
-            n = risk.definitions.territory_neighbors[curr_country]
+            n = self._NEI[curr_country]
             for neighbor in n:
                 if neighbor not in visited and self.owner(neighbor) != pid:
                     visited.add(neighbor)
@@ -306,101 +440,94 @@ class Board(object):
 
     def continent(self, continent_id):
         """
-        Create a generator of all territories that belong to a given continent.
-            
+        Find all territories that belong to a given continent.
+
         Args:
             continent_id (int): ID of the continent.
         Returns:
-            generator: Generator of Territories.
+            ndarray: Territory IDs of the continent's territories.
         """
-        return (t for t in self.data if t.territory_id in risk.definitions.continent_territories[continent_id])
+        return CONT_TERR[continent_id]
 
     def n_continents(self, player_id):
         """
         Calculate the total number of continents owned by a player.
-        
+
         Args:
             player_id (int): ID of the player.
-                
+
         Returns:
             int: Number of continents owned by the player.
         """
-        return len([continent_id for continent_id in range(6) if self.owns_continent(player_id, continent_id)])
+        owner_mask = self._owner_mask[player_id]
+        return sum(1 for mask in CONTINENT_MASK.values() if owner_mask & mask == mask)
 
     def owns_continent(self, player_id, continent_id):
         """
         Check if a player owns a continent.
-        
+
         Args:
             player_id (int): ID of the player.
             continent_id (int): ID of the continent.
-            
+
         Returns:
             bool: True if the player owns all of the continent's territories.
         """
-        return all((t.player_id == player_id for t in self.continent(continent_id)))
+        continent_mask = CONTINENT_MASK[continent_id]
+        return self._owner_mask[player_id] & continent_mask == continent_mask
 
     def continent_owner(self, continent_id):
         """
         Find the owner of all territories in a continent. If the continent
         is owned by various players, return None.
-            
+
         Args:
             continent_id (int): ID of the continent.
-                
+
         Returns:
             int/None: Player_id if a player owns all territories, else None.
         """
-        pids = set([t.player_id for t in self.continent(continent_id)])
-        if len(pids) == 1:
-            return pids.pop()
+        continent_mask = CONTINENT_MASK[continent_id]
+        # Check all six masks, not just the first _n_players: set_owner can
+        # hand territories to a player id the board was not created with.
+        for pid in range(6):
+            if self._owner_mask[pid] & continent_mask == continent_mask:
+                return pid
         return None
 
     def continent_fraction(self, continent_id, player_id):
         """
         Compute the fraction of a continent a player owns.
-        
+
         Args:
             continent_id (int): ID of the continent.
             player_id (int): ID of the player.
         Returns:
             float: The fraction of the continent owned by the player.
         """
-        c_data = list(self.continent(continent_id))
-        p_data = [t for t in c_data if t.player_id == player_id]
-        return float(len(p_data)) / len(c_data)
+        owned = self._owner_mask[player_id] & CONTINENT_MASK[continent_id]
+        return bin(owned).count('1') / CONT_SIZE[continent_id]
 
     def num_foreign_continent_territories(self, continent_id, player_id):
         """
         Compute the number of territories owned by other players on a given continent.
-        
+
         Args:
             continent_id (int): ID of the continent.
             player_id (int): ID of the player.
         Returns:
             int: The number of territories on the continent owned by other players.
         """
-        return sum(1 if t.player_id != player_id else 0 for t in self.continent(continent_id))
+        owned = self._owner_mask[player_id] & CONTINENT_MASK[continent_id]
+        return CONT_SIZE[continent_id] - bin(owned).count('1')
 
     # ==================== #
     # == Action Methods == #
-    # ==================== #    
+    # ==================== #
 
-    def reinforcements(self, player_id):
-        """
-        Calculate the number of reinforcements a player is entitled to.
-            
-        Args:
-            player_id (int): ID of the player.
-        Returns:
-            int: Number of reinforcement armies that the player is entitled to.
-        """
-        base_reinforcements = max(3, int(self.n_territories(player_id) / 3))
-        bonus_reinforcements = 0
-        for continent_id, bonus in risk.definitions.continent_bonuses.items():
-            if self.continent_owner(continent_id) == player_id:
-                bonus_reinforcements += bonus
-        return base_reinforcements + bonus_reinforcements
+    # Specialized at import time against the fixed continent table; see
+    # _specialize_reinforcements for the generated source.
+    reinforcements = _specialize_reinforcements()
 
     def possible_attacks(self, player_id):
         """
@@ -410,20 +537,22 @@ class Board(object):
         Returns:
             list: List of Moves.
         """
-        return [Move(from_t.territory_id, from_t.armies, to_t.territory_id, to_t.player_id, to_t.armies)
-                for from_t in self.mobile(player_id) for to_t in self.hostile_neighbors(from_t.territory_id)]
+        edges = risk.kernels.possible_attacks_nb(
+            self.owners, self.armies, player_id,
+            risk.kernels.NEIGH_FLAT, risk.kernels.NEIGH_OFF)
+        return [Move(*edge) for edge in edges.tolist()]
 
     def possible_fortifications(self, player_id):
         """
         Assemble a list of all possible fortifications for the players.
-        
+
         Args:
             player_id (int): ID of the attacking player.
         Returns:
             list: List of Moves.
         """
-        return [Move(from_t.territory_id, from_t.armies, to_t.territory_id, to_t.player_id, to_t.armies)
-                for from_t in self.mobile(player_id) for to_t in self.friendly_neighbors(from_t.territory_id)]
+        return [Move(int(from_t), int(self.armies[from_t]), to_t, player_id, int(self.armies[to_t]))
+                for from_t in self.mobile(player_id) for to_t in self.friendly_neighbors(from_t)]
 
     def fortify(self, from_territory, to_territory, n_armies):
         """
@@ -436,10 +565,10 @@ class Board(object):
             ValueError if the player moves too many or negative armies.
             ValueError if the territories do not share a border or are not owned by the same player.
         """
-        if n_armies < 0 or self.armies(from_territory) <= n_armies:
+        if n_armies < 0 or self.armies[from_territory] <= n_armies:
             raise ValueError('Board: Cannot move {n} armies from territory {tid}.'
                              .format(n=n_armies, tid=from_territory))
-        if to_territory not in [t.territory_id for t in self.friendly_neighbors(from_territory)]:
+        if to_territory not in self.friendly_neighbors(from_territory):
             raise ValueError('Board: Cannot fortify, territories do not share owner and/or border.')
         self.add_armies(from_territory, -n_armies)
         self.add_armies(to_territory, +n_armies)
@@ -457,14 +586,14 @@ class Board(object):
         Returns:
             bool: True if the defensive territory was conquered, False otherwise.
         """
-        if attackers < 1 or self.armies(from_territory) <= attackers:
+        if attackers < 1 or self.armies[from_territory] <= attackers:
             raise ValueError('Board: Cannot attack with {n} armies from territory {tid}.'
                              .format(n=attackers, tid=from_territory))
-        if to_territory not in [tid for (tid, _, _) in self.hostile_neighbors(from_territory)]:
+        if to_territory not in self.hostile_neighbors(from_territory):
             raise ValueError('Board: Cannot attack, territories do not share border or are owned by the same player.')
-        defenders = self.armies(to_territory)
+        defenders = int(self.armies[to_territory])
         def_wins, att_wins = self.fight(attackers, defenders)
-        if self.armies(to_territory) == att_wins:
+        if self.armies[to_territory] == att_wins:
             self.add_armies(from_territory, -attackers)
             self.set_armies(to_territory, attackers - def_wins)
             self.set_owner(to_territory, self.owner(from_territory))
@@ -476,12 +605,12 @@ class Board(object):
 
     # ====================== #
     # == Plotting Methods == #
-    # ====================== #    
+    # ====================== #
 
     def plot_board(self, path=None, plot_graph=False, filename=None):
-        """ 
-        Plot the board. 
-        
+        """
+        Plot the board.
+
         Args:
             path ([int]): a path of territory_ids to plot
             plot_graph (bool): if true, plots the graph structure overlayed on the board
@@ -529,8 +658,8 @@ class Board(object):
                     path.append(n)
                 plot_path(path)
 
-        for t in self.data:
-            self.plot_single(t.territory_id, t.player_id, t.armies)
+        for tid in range(len(self.owners)):
+            self.plot_single(tid, int(self.owners[tid]), int(self.armies[tid]))
 
         if not filename:
             plt.tight_layout()
@@ -543,32 +672,33 @@ class Board(object):
     def plot_single(territory_id, player_id, armies):
         """
         Plot a single army dot.
-            
+
         Args:
             territory_id (int): the id of the territory to plot,
             player_id (int): the player id of the owner,
             armies (int): the number of armies.
         """
         coor = risk.definitions.territory_locations[territory_id]
+        player_color = risk.definitions.player_colors[player_id]
         plt.scatter(
-            [coor[0]*1.2], 
-            [coor[1]*1.22], 
-            s=400, 
-            c=risk.definitions.player_colors[player_id],
+            [coor[0]*1.2],
+            [coor[1]*1.22],
+            s=400,
+            c=player_color,
             zorder=2
             )
         plt.text(
-            coor[0]*1.2, 
-            coor[1]*1.22 + 15, 
+            coor[0]*1.2,
+            coor[1]*1.22 + 15,
             s=str(armies),
-            color='black' if risk.definitions.player_colors[player_id] in ['yellow', 'pink'] else 'white',
-            ha='center', 
+            color='black' if player_color in ['yellow', 'pink'] else 'white',
+            ha='center',
             size=15
             )
 
     # ==================== #
     # == Combat Methods == #
-    # ==================== #    
+    # ==================== #
 
     @classmethod
     def fight(cls, attackers, defenders):
@@ -591,7 +721,7 @@ class Board(object):
     def throw_dice():
         """
         Throw a dice.
-        
+
         Returns:
             int: random int in [1, 6]. """
         return random.randint(1, 6)
@@ -608,17 +738,7 @@ class Board(object):
         Returns:
             int: Player_id that owns the territory.
         """
-        return self.data[territory_id].player_id
-
-    def armies(self, territory_id):
-        """
-        Get the number of armies on the territory.
-        Args:
-            territory_id (int): ID of the territory.
-        Returns:
-            int: Number of armies in the territory.
-        """
-        return self.data[territory_id].armies
+        return int(self.owners[territory_id])
 
     def set_owner(self, territory_id, player_id):
         """
@@ -627,7 +747,19 @@ class Board(object):
             territory_id (int): ID of the territory.
             player_id (int): ID of the player.
         """
-        self.data[territory_id] = Territory(territory_id, player_id, self.armies(territory_id))
+        old_pid = int(self.owners[territory_id])
+        n = int(self.armies[territory_id])
+        bit = 1 << territory_id
+        self._owner_mask[old_pid] &= ~bit
+        self._owner_mask[player_id] |= bit
+        self._armies_total[old_pid] -= n
+        self._armies_total[player_id] += n
+        cont_owned = self._cont_owned[TERR_TO_CONT[territory_id]]
+        cont_owned[old_pid] -= 1
+        cont_owned[player_id] += 1
+        if player_id >= self._n_players:
+            self._n_players = player_id + 1
+        self.owners[territory_id] = player_id
 
     def set_armies(self, territory_id, n):
         """
@@ -636,12 +768,12 @@ class Board(object):
             territory_id (int): ID of the territory.
             n (int): Number of armies on the territory.
         Raises:
-            ValueError if n < 1.
+            ValueError if n < 1. The check is skipped when running with -O.
         """
-        if n < 1:
+        if __debug__ and n < 1:
             raise ValueError('Board: cannot set the number of armies to <1 ({tid}, {n}).'.format(tid=territory_id, n=n))
-        self.data[territory_id] = Territory(territory_id,
-                self.owner(territory_id), n)
+        self._armies_total[self.owners[territory_id]] += n - int(self.armies[territory_id])
+        self.armies[territory_id] = n
 
     def add_armies(self, territory_id, n):
         """
@@ -650,9 +782,14 @@ class Board(object):
             territory_id (int): ID of the territory.
             n (int): Number of armies to add to the territory.
         Raises:
-            ValueError if the resulting number of armies is <1.
+            ValueError if the resulting number of armies is <1. The check
+            is skipped when running with -O.
         """
-        self.set_armies(territory_id, self.armies(territory_id) + n)
+        if __debug__ and self.armies[territory_id] + n < 1:
+            raise ValueError('Board: cannot set the number of armies to <1 ({tid}, {n}).'
+                             .format(tid=territory_id, n=int(self.armies[territory_id]) + n))
+        self._armies_total[self.owners[territory_id]] += n
+        self.armies[territory_id] += n
 
     def n_armies(self, player_id):
         """
@@ -662,7 +799,7 @@ class Board(object):
         Returns:
             int: Number of armies owned by the player.
         """
-        return sum((t.armies for t in self.data if t.player_id == player_id))
+        return self._armies_total[player_id]
 
     def n_territories(self, player_id):
         """
@@ -672,27 +809,25 @@ class Board(object):
         Returns:
             int: Number of territories owned by the player.
         """
-        return len([None for t in self.data if t.player_id == player_id])
+        return bin(self._owner_mask[player_id]).count('1')
 
     def territories_of(self, player_id):
         """
-        Return a set of all territories owned by the player.
+        Return the territories owned by the player.
         Args:
             player_id (int): ID of the player.
         Returns:
-            list: List of all territory IDs owner by the player.
+            ndarray: Array of all territory IDs owned by the player.
         """
-        return [t.territory_id for t in self.data if t.player_id == player_id]
+        return np.nonzero(self.owners == player_id)[0]
 
     def mobile(self, player_id):
         """
-        Create a generator of all
-        territories of a player which can attack or move,
+        Find all territories of a player which can attack or move,
         i.e. that have more than one army.
         Args:
             player_id (int): ID of the attacking player.
         Returns:
-            generator: Generator of Territories.
+            ndarray: Array of territory IDs.
         """
-        return (t for t in self.data if
-                (t.player_id == player_id and t.armies > 1))
+        return np.nonzero((self.owners == player_id) & (self.armies > 1))[0]
@@ -1,3 +1,5 @@
+import numpy as np
+
 territory_names = {
     0: 'afghanistan',
     1: 'alaska',
@@ -167,3 +169,16 @@ starting_armies = {
     4: 30,
     5: 25,
     6: 20}
+
+# CSR layout of the adjacency graph: the neighbors of territory t are
+# neighbors_flat[neighbors_offsets[t]:neighbors_offsets[t+1]]. Built once
+# at import so traversals walk contiguous int8 buffers instead of the
+# dicts of lists above.
+neighbors_offsets = np.cumsum(
+    [0] + [len(territory_neighbors[t]) for t in range(42)], dtype=np.int32)
+neighbors_flat = np.fromiter(
+    (n for t in range(42) for n in territory_neighbors[t]), np.int8)
+
+# Per-continent bonus armies as a dense vector, indexed by continent id.
+continent_bonuses_array = np.fromiter(
+    (continent_bonuses[c] for c in range(6)), np.int32)
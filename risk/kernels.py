@@ -0,0 +1,86 @@
+"""
+Numba-compiled kernels for the hot Board queries.
+
+The board state lives in flat numpy arrays (see risk.board), so the
+per-turn hotspots (possible_attacks, batch board setup) can be compiled
+to native code. The static adjacency is laid out in CSR form: a flat
+array of neighbor ids plus an offsets array, so the kernels walk
+contiguous buffers instead of Python dicts of lists.
+
+numba is optional: if it is not installed the kernels run as plain Python
+functions with identical results.
+"""
+import numpy as np
+
+import risk.definitions
+
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+
+        def decorate(func):
+            return func
+        return decorate
+
+# The CSR tables themselves live in risk.definitions next to the rest of
+# the static map data; these aliases are the names the kernels take.
+NEIGH_OFF = risk.definitions.neighbors_offsets
+NEIGH_FLAT = risk.definitions.neighbors_flat
+
+
+@njit(cache=True)
+def possible_attacks_nb(owners, armies, player_id, neigh_flat, neigh_off):
+    """
+    Enumerate all attack edges for a player.
+
+    Args:
+        owners (int8[:]): owner of each territory.
+        armies (int32[:]): armies on each territory.
+        player_id (int): ID of the attacking player.
+        neigh_flat (int8[:]): CSR neighbor ids.
+        neigh_off (int32[:]): CSR offsets.
+    Returns:
+        int32[:, :]: one row (from_tid, from_armies, to_tid, to_pid, to_armies) per attack.
+    """
+    out = np.empty((neigh_flat.shape[0], 5), np.int32)
+    k = 0
+    for from_t in range(owners.shape[0]):
+        if owners[from_t] != player_id or armies[from_t] <= 1:
+            continue
+        from_armies = armies[from_t]
+        for i in range(neigh_off[from_t], neigh_off[from_t + 1]):
+            to_t = neigh_flat[i]
+            to_pid = owners[to_t]
+            if to_pid != player_id:
+                out[k, 0] = from_t
+                out[k, 1] = from_armies
+                out[k, 2] = to_t
+                out[k, 3] = to_pid
+                out[k, 4] = armies[to_t]
+                k += 1
+    return out[:k]
+
+
+@njit(cache=True)
+def init_owners_batch_nb(n_players, out):
+    """
+    Fill a batch of owner arrays with independently random allocations.
+
+    Each row is tiled with 0..n_players-1 and then shuffled in place with
+    Fisher-Yates, using the native RNG when compiled so batch setup does
+    no per-element work in the interpreter.
+
+    Args:
+        n_players (int): Number of players per board.
+        out (int8[:, :]): (n_boards, 42) owner array, written in place.
+    """
+    n_boards, n_territories = out.shape
+    for i in range(n_boards):
+        for t in range(n_territories):
+            out[i, t] = t % n_players
+        for t in range(n_territories - 1, 0, -1):
+            j = np.random.randint(t + 1)
+            out[i, t], out[i, j] = out[i, j], out[i, t]
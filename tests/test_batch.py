@@ -0,0 +1,50 @@
+from risk.batch import BoardBatch
+from risk.board import Board
+import risk.definitions
+import numpy as np
+
+# a batch with varied army counts and a forced continent ownership,
+# checked element-for-element against the scalar Board implementation
+np.random.seed(0)
+batch = BoardBatch.create(16, 3)
+batch.armies[:] = np.random.randint(1, 9, size=batch.armies.shape)
+batch.owners[0, risk.definitions.continent_territories[5]] = 1
+
+boards = [Board._from_arrays(batch.owners[i].copy(), batch.armies[i].copy())
+          for i in range(batch.n_boards)]
+
+
+def test__create():
+    created = BoardBatch.create(50, 4)
+    assert created.n_boards == 50
+    assert (created.armies == 1).all()
+    for i in range(50):
+        counts = sorted(np.bincount(created.owners[i], minlength=4).tolist())
+        assert counts == [10, 10, 11, 11]
+
+def test__owner():
+    for t in range(42):
+        assert batch.owner(t).tolist() == [b.owner(t) for b in boards]
+
+def test__n_territories():
+    for pid in range(3):
+        assert batch.n_territories(pid).tolist() == [b.n_territories(pid) for b in boards]
+
+def test__n_armies():
+    for pid in range(3):
+        assert batch.n_armies(pid).tolist() == [b.n_armies(pid) for b in boards]
+
+def test__owns_continent():
+    for pid in range(3):
+        for cid in range(6):
+            assert batch.owns_continent(pid, cid).tolist() == [b.owns_continent(pid, cid) for b in boards]
+
+def test__mobile():
+    for pid in range(3):
+        mobile = batch.mobile(pid)
+        for i, board in enumerate(boards):
+            assert np.nonzero(mobile[i])[0].tolist() == board.mobile(pid).tolist()
+
+def test__reinforcements():
+    for pid in range(3):
+        assert batch.reinforcements(pid).tolist() == [b.reinforcements(pid) for b in boards]
@@ -0,0 +1,215 @@
+from risk.board import Board, Territory
+import risk.definitions
+import copy
+import random
+
+# define boards for the tests
+# each is mutated through the public setters so that the incrementally
+# maintained caches (_owner_mask, _armies_total, _cont_owned) are exercised,
+# and every test checks a query method against values recomputed by brute
+# force from the owners/armies arrays
+board0 = Board([Territory(territory_id=i, player_id=1, armies=i % 5 + 1) for i in range(42)])
+
+board1 = copy.deepcopy(board0)
+for t in risk.definitions.continent_territories[5]:
+    board1.set_owner(t, 0)
+board1.set_armies(3, 500)
+board1.add_armies(4, 7)
+
+board2 = Board([Territory(territory_id=i, player_id=i % 5, armies=i % 5 + 1) for i in range(42)])
+for t in range(0, 42, 2):
+    board2.set_owner(t, (t + 1) % 4)
+for t in range(0, 42, 3):
+    board2.set_armies(t, t + 1)
+for t in range(0, 42, 7):
+    board2.add_armies(t, 3)
+
+boards = [board0, board1, board2]
+
+
+def check_caches(board):
+    for pid in range(6):
+        assert board._owner_mask[pid] == sum(1 << t for t in range(42) if board.owner(t) == pid)
+        assert board._armies_total[pid] == sum(int(board.armies[t]) for t in range(42) if board.owner(t) == pid)
+    for cid in range(6):
+        for pid in range(6):
+            assert board._cont_owned[cid][pid] == sum(
+                1 for t in risk.definitions.continent_territories[cid] if board.owner(t) == pid)
+
+
+def test__caches_after_mutations_1():
+    check_caches(board0)
+
+def test__caches_after_mutations_2():
+    check_caches(board1)
+
+def test__caches_after_mutations_3():
+    check_caches(board2)
+
+
+def test__n_armies():
+    for board in boards:
+        for pid in range(6):
+            assert board.n_armies(pid) == sum(int(board.armies[t]) for t in range(42) if board.owner(t) == pid)
+
+def test__n_territories():
+    for board in boards:
+        for pid in range(6):
+            assert board.n_territories(pid) == sum(1 for t in range(42) if board.owner(t) == pid)
+
+def test__territories_of():
+    for board in boards:
+        for pid in range(6):
+            assert board.territories_of(pid).tolist() == [t for t in range(42) if board.owner(t) == pid]
+
+def test__mobile():
+    for board in boards:
+        for pid in range(6):
+            assert board.mobile(pid).tolist() == [
+                t for t in range(42) if board.owner(t) == pid and board.armies[t] > 1]
+
+
+def test__owns_continent():
+    for board in boards:
+        for cid in range(6):
+            for pid in range(6):
+                expected = all(board.owner(t) == pid for t in risk.definitions.continent_territories[cid])
+                assert board.owns_continent(pid, cid) == expected
+
+def test__continent_owner():
+    for board in boards:
+        for cid in range(6):
+            owners = set(board.owner(t) for t in risk.definitions.continent_territories[cid])
+            expected = owners.pop() if len(owners) == 1 else None
+            assert board.continent_owner(cid) == expected
+
+def test__continent_owner_new_player():
+    # a player id introduced by set_owner after construction must be seen
+    board = Board([Territory(territory_id=i, player_id=0, armies=1) for i in range(42)])
+    for t in risk.definitions.continent_territories[2]:
+        board.set_owner(t, 3)
+    assert board.owns_continent(3, 2)
+    assert board.continent_owner(2) == 3
+
+def test__n_players_tracks_introduced_players():
+    board = Board([Territory(territory_id=i, player_id=0, armies=1) for i in range(42)])
+    assert board.n_players == 1
+    board.set_owner(0, 4)
+    assert board.n_players == 5
+
+def test__continent_fraction():
+    for board in boards:
+        for cid in range(6):
+            tids = risk.definitions.continent_territories[cid]
+            for pid in range(6):
+                expected = sum(1 for t in tids if board.owner(t) == pid) / len(tids)
+                assert board.continent_fraction(cid, pid) == expected
+
+def test__num_foreign_continent_territories():
+    for board in boards:
+        for cid in range(6):
+            for pid in range(6):
+                expected = sum(1 for t in risk.definitions.continent_territories[cid] if board.owner(t) != pid)
+                assert board.num_foreign_continent_territories(cid, pid) == expected
+
+def test__n_continents():
+    for board in boards:
+        for pid in range(6):
+            expected = sum(1 for cid in range(6)
+                           if all(board.owner(t) == pid for t in risk.definitions.continent_territories[cid]))
+            assert board.n_continents(pid) == expected
+
+def test__reinforcements():
+    for board in boards:
+        for pid in range(6):
+            expected = max(3, board.n_territories(pid) // 3) + sum(
+                bonus for cid, bonus in risk.definitions.continent_bonuses.items()
+                if all(board.owner(t) == pid for t in risk.definitions.continent_territories[cid]))
+            assert board.reinforcements(pid) == expected
+
+
+def test__neighbors():
+    for board in boards:
+        for t in range(42):
+            assert sorted(board.neighbors(t)) == sorted(risk.definitions.territory_neighbors[t])
+
+def test__hostile_neighbors():
+    for board in boards:
+        for t in range(42):
+            expected = sorted(n for n in risk.definitions.territory_neighbors[t]
+                              if board.owner(n) != board.owner(t))
+            assert sorted(board.hostile_neighbors(t)) == expected
+
+def test__friendly_neighbors():
+    for board in boards:
+        for t in range(42):
+            expected = sorted(n for n in risk.definitions.territory_neighbors[t]
+                              if board.owner(n) == board.owner(t))
+            assert sorted(board.friendly_neighbors(t)) == expected
+
+
+def test__possible_attacks():
+    for board in boards:
+        for pid in range(6):
+            expected = sorted(
+                (fr, int(board.armies[fr]), to, board.owner(to), int(board.armies[to]))
+                for fr in range(42) if board.owner(fr) == pid and board.armies[fr] > 1
+                for to in risk.definitions.territory_neighbors[fr] if board.owner(to) != pid)
+            assert sorted(tuple(m) for m in board.possible_attacks(pid)) == expected
+
+def test__possible_fortifications():
+    for board in boards:
+        for pid in range(6):
+            expected = sorted(
+                (fr, int(board.armies[fr]), to, pid, int(board.armies[to]))
+                for fr in range(42) if board.owner(fr) == pid and board.armies[fr] > 1
+                for to in risk.definitions.territory_neighbors[fr] if board.owner(to) == pid)
+            assert sorted(tuple(m) for m in board.possible_fortifications(pid)) == expected
+
+
+def test__fortify():
+    board = copy.deepcopy(board0)
+    board.set_armies(1, 5)
+    before = int(board.armies[2])
+    board.fortify(1, 2, 3)
+    assert board.armies[1] == 2
+    assert board.armies[2] == before + 3
+    check_caches(board)
+
+def test__fortify_invalid():
+    board = copy.deepcopy(board0)
+    board.set_armies(1, 5)
+    try:
+        board.fortify(1, 2, 5)  # too many armies
+        assert False
+    except ValueError:
+        pass
+    try:
+        board.fortify(1, 34, 1)  # not a neighbor
+        assert False
+    except ValueError:
+        pass
+
+def test__attack():
+    random.seed(0)
+    board = copy.deepcopy(board2)
+    for _ in range(30):
+        moves = [m for pid in range(5) for m in board.possible_attacks(pid)]
+        if not moves:
+            break
+        move = random.choice(moves)
+        board.attack(move.from_territory_id, move.to_territory_id, move.from_armies - 1)
+    check_caches(board)
+
+def test__attack_invalid():
+    board = copy.deepcopy(board0)
+    try:
+        board.attack(1, 19, 1)  # both owned by player 1
+        assert False
+    except ValueError:
+        pass
+    try:
+        board.attack(1, 19, 5)  # more attackers than armies
+        assert False
+    except ValueError:
+        pass
@@ -0,0 +1,40 @@
+from risk.board import Board, Territory
+from risk.batch import BoardBatch
+import risk.kernels
+import importlib
+import sys
+import numpy as np
+
+# a board with a mix of owners and army counts for attack enumeration
+board0 = Board([Territory(territory_id=i, player_id=i % 3, armies=i % 4 + 1) for i in range(42)])
+
+
+def run_kernel_checks():
+    for pid in range(3):
+        expected = sorted(
+            (fr, int(board0.armies[fr]), to, board0.owner(to), int(board0.armies[to]))
+            for fr in range(42) if board0.owner(fr) == pid and board0.armies[fr] > 1
+            for to in board0.neighbors(fr) if board0.owner(to) != pid)
+        assert sorted(tuple(m) for m in board0.possible_attacks(pid)) == expected
+    batch = BoardBatch.create(8, 3)
+    for i in range(8):
+        counts = sorted(np.bincount(batch.owners[i], minlength=3).tolist())
+        assert counts == [14, 14, 14]
+
+
+def test__kernels_compiled():
+    run_kernel_checks()
+
+
+def test__kernels_python_fallback():
+    # reload risk.kernels with numba unimportable so the njit shim is used;
+    # the module promises identical results on the plain-Python path
+    sys.modules['numba'] = None
+    try:
+        importlib.reload(risk.kernels)
+        assert not hasattr(risk.kernels.possible_attacks_nb, 'py_func')
+        assert not hasattr(risk.kernels.init_owners_batch_nb, 'py_func')
+        run_kernel_checks()
+    finally:
+        del sys.modules['numba']
+        importlib.reload(risk.kernels)